@@ -41,5 +41,8 @@ PY_PULUMIRPC=../python/lib/pulumi/runtime/proto/
 echo -e "\tPython: $PY_PULUMIRPC"
 mkdir -p $PY_PULUMIRPC
 python -m grpc_tools.protoc -I./ --python_out=$PY_PULUMIRPC --grpc_python_out=$PY_PULUMIRPC *.proto
+# protoc emits absolute imports for sibling protos; rewrite them as relative imports so the
+# generated files work as part of the pulumi.runtime.proto package.
+sed -i.bak 's/^import \([a-z_]*_pb2\) as \([a-z_]*__pb2\)$/from . import \1 as \2/' $PY_PULUMIRPC/*.py && rm $PY_PULUMIRPC/*.bak
 
 echo Done.
@@ -20,7 +20,7 @@ The primary Pulumi Python SDK package.
 __all__ = ['runtime']
 
 # Make all module members inside of this package available as package members.
-from config import *
-from errors import *
-from metadata import *
-from resource import *
+from .config import *
+from .errors import *
+from .metadata import *
+from .resource import *
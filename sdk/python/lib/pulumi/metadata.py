@@ -12,7 +12,7 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-import runtime
+from . import runtime
 
 def get_project():
     """
@@ -16,15 +16,60 @@
 The Pulumi SDK runtime's Protobufs and gRPC stubs.  These are meant for internal use only.
 """
 
-from analyzer_pb2 import *
-from analyzer_pb2_grpc import *
-from engine_pb2 import *
-from engine_pb2_grpc import *
-from language_pb2 import *
-from language_pb2_grpc import *
-from plugin_pb2 import *
-from plugin_pb2_grpc import *
-from provider_pb2 import *
-from provider_pb2_grpc import *
-from resource_pb2 import *
-from resource_pb2_grpc import *
+import os
+
+# Prefer the C-backed (upb) protobuf implementation; the pure-Python fallback is one to two
+# orders of magnitude slower at serializing and parsing, which every provider and resource
+# monitor RPC would pay for.  This default is best-effort only -- google.protobuf is usually
+# already loaded by the time this module runs (e.g. via runtime.rpc's struct_pb2 import), in
+# which case the implementation choice is locked in -- so the actual enforcement is the
+# api_implementation check below.  The language host sets the same default before any imports.
+os.environ.setdefault('PROTOCOL_BUFFERS_PYTHON_IMPLEMENTATION', 'upb')
+
+from google.protobuf.internal import api_implementation
+
+# Deliberately not an ImportError: the language host treats ImportError from the pulumi package
+# as "the SDK is not installed", which would swallow this diagnostic.
+if api_implementation.Type() == 'python':
+    raise RuntimeError(
+        'the protobuf library is using its pure-Python implementation, which is too slow for the '
+        'Pulumi runtime; install protobuf>=4.21 and ensure PROTOCOL_BUFFERS_PYTHON_IMPLEMENTATION '
+        'is not set to "python"')
+
+from .engine_pb2 import *
+from .engine_pb2_grpc import *
+from .plugin_pb2 import *
+from .plugin_pb2_grpc import *
+from .provider_pb2 import *
+from .resource_pb2 import *
+from .resource_pb2_grpc import *
+
+# The modules below are deliberately not imported above: a program run only ever speaks the
+# resource monitor and engine protocols, so building the analyzer and language host descriptors
+# (and the provider service stubs) would be pure import-time overhead for it.  Load those modules
+# on first use instead (PEP 562).  Note that provider_pb2 itself stays eager, since resource_pb2
+# depends on its descriptors anyway.
+_LAZY_MODULES = ['analyzer_pb2', 'analyzer_pb2_grpc', 'language_pb2', 'language_pb2_grpc',
+                 'provider_pb2_grpc']
+
+def __getattr__(name):
+    # Probes for private/dunder names (hasattr, the pickle and copy protocols, and so on) are
+    # expected to fail; never let them force the deferred modules to load.
+    if name.startswith('_'):
+        raise AttributeError("module '%s' has no attribute '%s'" % (__name__, name))
+    import importlib
+    for module_name in _LAZY_MODULES:
+        if module_name in globals():
+            continue
+        module = importlib.import_module('.' + module_name, __name__)
+        globals()[module_name] = module
+        for key, value in vars(module).items():
+            if not key.startswith('_'):
+                globals().setdefault(key, value)
+        # Stop as soon as the requested name is resolved so an access only pays for the modules
+        # up to and including the one that defines it.
+        if name in globals():
+            return globals()[name]
+    if name in globals():
+        return globals()[name]
+    raise AttributeError("module '%s' has no attribute '%s'" % (__name__, name))
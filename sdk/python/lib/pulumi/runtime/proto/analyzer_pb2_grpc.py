@@ -15,9 +15,9 @@
 # Generated by the gRPC Python protocol compiler plugin. DO NOT EDIT!
 import grpc
 
-import analyzer_pb2 as analyzer__pb2
+from . import analyzer_pb2 as analyzer__pb2
 from google.protobuf import empty_pb2 as google_dot_protobuf_dot_empty__pb2
-import plugin_pb2 as plugin__pb2
+from . import plugin_pb2 as plugin__pb2
 
 
 class AnalyzerStub(object):
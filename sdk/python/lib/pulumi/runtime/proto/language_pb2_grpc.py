@@ -16,8 +16,8 @@
 import grpc
 
 from google.protobuf import empty_pb2 as google_dot_protobuf_dot_empty__pb2
-import language_pb2 as language__pb2
-import plugin_pb2 as plugin__pb2
+from . import language_pb2 as language__pb2
+from . import plugin_pb2 as plugin__pb2
 
 
 class LanguageRuntimeStub(object):
@@ -16,8 +16,8 @@
 import grpc
 
 from google.protobuf import empty_pb2 as google_dot_protobuf_dot_empty__pb2
-import plugin_pb2 as plugin__pb2
-import provider_pb2 as provider__pb2
+from . import plugin_pb2 as plugin__pb2
+from . import provider_pb2 as provider__pb2
 
 
 class ResourceProviderStub(object):
@@ -16,8 +16,8 @@
 import grpc
 
 from google.protobuf import empty_pb2 as google_dot_protobuf_dot_empty__pb2
-import provider_pb2 as provider__pb2
-import resource_pb2 as resource__pb2
+from . import provider_pb2 as provider__pb2
+from . import resource_pb2 as resource__pb2
 
 
 class ResourceMonitorStub(object):
@@ -18,9 +18,9 @@ Resource-related runtime functions.  These are not designed for external use.
 
 from ..errors import RunError
 from google.protobuf import struct_pb2
-from proto import provider_pb2, resource_pb2
-from settings import get_monitor
-import rpc
+from .proto import provider_pb2, resource_pb2
+from .settings import get_monitor
+from . import rpc
 import six
 import sys
 import grpc
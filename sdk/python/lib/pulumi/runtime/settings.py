@@ -17,7 +17,7 @@ Runtime settings and configuration.
 """
 
 import grpc
-from proto import engine_pb2_grpc, resource_pb2_grpc
+from .proto import engine_pb2_grpc, resource_pb2_grpc
 from ..errors import RunError
 
 class Settings(object):
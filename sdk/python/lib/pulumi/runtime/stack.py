@@ -17,7 +17,7 @@ Support for automatic stack components.
 """
 
 from ..resource import ComponentResource
-from settings import get_project, get_stack, get_root_resource, set_root_resource
+from .settings import get_project, get_stack, get_root_resource, set_root_resource
 
 def run_in_stack(func):
     """
@@ -12,13 +12,15 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-class Unknown(unicode):
+import six
+
+class Unknown(six.text_type):
     """
     Unknown is a class representing values that are not known during
     previews. This class is designed to lie its way through the entire
     Pulumi runtime.
 
-    We inherit from `unicode` to lie to resources that we are a string.
+    We inherit from the text type to lie to resources that we are a string.
     """
     def __getattribute__(self, attr):
         """
@@ -30,13 +32,16 @@ class Unknown(unicode):
         """
         return Unknown()
 
-    def __nonzero__(self):
+    def __bool__(self):
         """
         Called whenever this value is coerced to a boolean, via "bool" or the "not"
         operator. This value is not zero, so we return True.
         """
         return True
 
+    # Python 2 spells __bool__ differently.
+    __nonzero__ = __bool__
+
     def __str__(self):
         """
         Called whenever this value is coerced to a string, via "str".
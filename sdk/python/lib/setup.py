@@ -24,7 +24,8 @@ setup(name='pulumi',
       packages=find_packages(),
       install_requires=[
           'google==2.0.1',
-          'grpcio==1.9.1',
+          'grpcio>=1.50',
+          'protobuf>=4.21',
           'six==1.11.0'
       ],
       zip_safe=False)